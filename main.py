@@ -1,16 +1,54 @@
 import csv
 import datetime
+import sys
+from enum import IntEnum
+from functools import lru_cache
+
+
+class Status(IntEnum):
+    """BTO application status; prints as e.g. 'Pending'."""
+    PENDING = 0
+    SUCCESSFUL = 1
+    UNSUCCESSFUL = 2
+    BOOKED = 3
+
+    def __str__(self):
+        return self.name.capitalize()
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+
+# Officer registration / flat-type / marital strings are interned so that
+# equality checks against them short-circuit on identity.
+PENDING = sys.intern("Pending")
+APPROVED = sys.intern("Approved")
+REJECTED = sys.intern("Rejected")
+FT2 = sys.intern("2-Room")
+FT3 = sys.intern("3-Room")
+SINGLE = sys.intern("single")
+
+# Menu input ("2"/"3") -> flat type.
+FLAT_TYPE_MAP = {"2": FT2, "3": FT3}
+
+# Application statuses that block a new application / allow withdrawal.
+_ACTIVE_STATUSES = frozenset((Status.PENDING, Status.SUCCESSFUL))
+# Application statuses that can no longer be withdrawn.
+_CLOSED_STATUSES = frozenset((Status.UNSUCCESSFUL, Status.BOOKED))
 
 class User:
     """
     Base class for all users (Applicant, HDBOfficer, HDBManager).
     """
+    __slots__ = ("userID", "password", "age", "marital_status", "name", "_marital_lower")
+
     def __init__(self, user_id, password, age, marital_status, name):
         self.userID = user_id
         self.password = password
         self.age = age
         self.marital_status = marital_status
         self.name = name
+        self._marital_lower = sys.intern(marital_status.lower())
 
     def changePassword(self, new_password):
         self.password = new_password
@@ -21,19 +59,22 @@ class User:
         Default: show all projects (including hidden).
         Subclasses can override or filter if desired.
         """
-        print("==== All Projects ====")
-        for p in projects:
-            p.displayInfo()
+        sys.stdout.write("==== All Projects ====\n"
+                         + "".join(p.infoBlock() for p in projects))
 
 
 class Applicant(User):
     """
     Applicant extends User.
     """
+    __slots__ = ("applications", "enquiries", "_eligible_types")
+
     def __init__(self, user_id, password, age, marital_status, name):
         super().__init__(user_id, password, age, marital_status, name)
         self.applications = []
         self.enquiries = []
+        self._eligible_types = ((FT2,) if self._marital_lower == SINGLE
+                                else (FT2, FT3))
 
     def applyForProject(self, project, flat_type, application_controller):
         """
@@ -41,28 +82,26 @@ class Applicant(User):
         Married (21+ years) can apply for 2-Room or 3-Room.
         Cannot apply for multiple projects at once (only one active application).
         """
-        active_app = [app for app in self.applications 
-                      if app.applicationStatus in ["Pending","Successful"]]
-        if active_app:
+        if any(app.applicationStatus in _ACTIVE_STATUSES for app in self.applications):
             print("You already have an active application. Cannot apply again.")
             return
 
-        if self.marital_status.lower() == "single":
+        if self._marital_lower == SINGLE:
             if self.age < 35:
                 print("Single applicants must be at least 35 years old.")
                 return
-            if flat_type != "2-Room":
+            if flat_type != FT2:
                 print("Single (≥35) can ONLY apply for 2-Room.")
                 return
         else:
             if self.age < 21:
                 print("Married applicants must be at least 21 years old.")
                 return
-            if flat_type not in ["2-Room", "3-Room"]:
+            if flat_type not in self._eligible_types:
                 print("Married applicants can apply for 2-Room or 3-Room only.")
                 return
 
-        if project.flatTypes[flat_type]["units"] <= 0:
+        if project.units(flat_type) <= 0:
             print(f"No available units for {flat_type} in project '{project.projectName}'.")
             return
 
@@ -75,11 +114,12 @@ class Applicant(User):
         if not self.applications:
             print("You have no applications.")
             return
-        print("==== Your BTO Applications ====")
-        for app in self.applications:
-            print(f"- Project: {app.BTOProject.projectName} "
-                  f"| Status: {app.applicationStatus} "
-                  f"| Flat Type: {app.chosen_flat_type}")
+        lines = ["==== Your BTO Applications ===="]
+        lines.extend(f"- Project: {app.BTOProject.projectName} "
+                     f"| Status: {app.applicationStatus} "
+                     f"| Flat Type: {app.chosen_flat_type}"
+                     for app in self.applications)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def requestWithdrawal(self):
         """
@@ -98,7 +138,7 @@ class Applicant(User):
             choice_idx = int(choice) - 1
             if 0 <= choice_idx < len(self.applications):
                 app_to_withdraw = self.applications[choice_idx]
-                if app_to_withdraw.applicationStatus in ["Unsuccessful","Booked"]:
+                if app_to_withdraw.applicationStatus in _CLOSED_STATUSES:
                     print("This application is either unsuccessful or booked; cannot withdraw.")
                     return
                 app_to_withdraw.requested_withdrawal = True
@@ -118,11 +158,12 @@ class Applicant(User):
         if not self.enquiries:
             print("You have no enquiries.")
             return
-        print("==== Your Enquiries ====")
+        lines = ["==== Your Enquiries ===="]
         for i, enq in enumerate(self.enquiries, start=1):
-            print(f"{i}. {enq.message}")
+            lines.append(f"{i}. {enq.message}")
             if enq.response:
-                print(f"   Response: {enq.response}")
+                lines.append(f"   Response: {enq.response}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def deleteEnquiry(self, inquiry_controller):
         if not self.enquiries:
@@ -135,9 +176,7 @@ class Applicant(User):
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(self.enquiries):
-                to_remove = self.enquiries[idx]
-                inquiry_controller.deleteInquiry(to_remove)
-                self.enquiries.remove(to_remove)
+                inquiry_controller.deleteInquiry(self.enquiries.pop(idx))
                 print("Enquiry deleted.")
             else:
                 print("Invalid choice.")
@@ -149,46 +188,27 @@ class Applicant(User):
         Override to display only the projects that this Applicant is eligible for,
         and that have > 0 units in the relevant flat type(s), and are visible.
         """
-        eligible_projects = []
-
-        if self.marital_status.lower() == "single" and self.age < 35:
+        is_single = self._marital_lower == SINGLE
+        if is_single and self.age < 35:
             print("You are under 35 and single; no projects are eligible.")
             return
 
-        if self.marital_status.lower() != "single" and self.age < 21:
+        if not is_single and self.age < 21:
             print("You are under 21 and married; no projects are eligible.")
             return
 
-        if self.marital_status.lower() == "single":
-            can_apply_types = ["2-Room"]
+        if is_single:
+            eligible_projects = [p for p in projects if p.visibility and p.units_2 > 0]
         else:
-            can_apply_types = ["2-Room", "3-Room"]
-
-        for p in projects:
-            if not p.visibility:
-                continue
-
-            has_available_type = False
-            for t in can_apply_types:
-                if t in p.flatTypes and p.flatTypes[t]["units"] > 0:
-                    has_available_type = True
-                    break
-
-            if has_available_type:
-                eligible_projects.append(p)
+            eligible_projects = [p for p in projects
+                                 if p.visibility and (p.units_2 > 0 or p.units_3 > 0)]
 
         if not eligible_projects:
             print("No projects available based on your eligibility and current unit availability.")
             return
 
-        print("==== Eligible Projects ====")
-        for p in eligible_projects:
-            print(f"[ProjectID={p.projectID}] {p.projectName} | Neighborhood: {p.neighborhood} | Visible: {p.visibility}")
-            if p.applicationOpenDate and p.applicationCloseDate:
-                print(f"   Application Period: {p.applicationOpenDate} to {p.applicationCloseDate}")
-            for ft, info in p.flatTypes.items():
-                print(f"   {ft}: {info['units']} units, Price: {info['price']}")
-            print()
+        sys.stdout.write("==== Eligible Projects ====\n"
+                         + "".join(p.infoBlock() for p in eligible_projects))
 
 
 class HDBOfficer(Applicant):
@@ -197,8 +217,16 @@ class HDBOfficer(Applicant):
     all applicant methods (applyForProject, viewApplicationStatus, etc.)
     plus the extra Officer methods.
     """
+    __slots__ = ("handling_project", "registration_status", "registered_project", "loadOrder")
+
+    officer_counter = 0
+
     def __init__(self, user_id, password, age, marital_status, name):
         super().__init__(user_id, password, age, marital_status, name)
+        # Position in the officer list (officers are created as they are loaded);
+        # the manager's pending-registration menu is numbered in this order.
+        self.loadOrder = HDBOfficer.officer_counter
+        HDBOfficer.officer_counter += 1
         self.handling_project = None
         self.registration_status = None
         self.registered_project = None
@@ -215,12 +243,19 @@ class HDBOfficer(Applicant):
             return
 
         for app in self.applications:
-            if app.BTOProject == project:
+            if app.BTOProject is project:
                 print("You have already applied for this project as an Applicant. Cannot register as Officer.")
                 return
 
+        # A new registration replaces any earlier pending one.
+        previous = self.registered_project
+        if self.registration_status == PENDING and previous and previous.manager:
+            previous.manager.pending_officer_regs.pop(self, None)
+
         self.registered_project = project
-        self.registration_status = "Pending"
+        self.registration_status = PENDING
+        if project.manager:
+            project.manager.pending_officer_regs[self] = None
         print(f"Registration to handle project '{project.projectName}' submitted (Pending).")
 
     def viewApplicantStatusInProject(self, applicant):
@@ -231,13 +266,13 @@ class HDBOfficer(Applicant):
             print("You are not handling any project currently.")
             return
         for app in applicant.applications:
-            if app.BTOProject == self.handling_project:
+            if app.BTOProject is self.handling_project:
                 print(f"{applicant.name} has status {app.applicationStatus} in {app.BTOProject.projectName}.")
                 return
         print("No application found for this applicant in your project.")
 
     def updateFlatAvailability(self, project, flat_type, number_booked):
-        if self.handling_project != project:
+        if self.handling_project is not project:
             print("You are not handling this project.")
             return
         project.reduceUnits(flat_type, number_booked)
@@ -260,7 +295,7 @@ class HDBOfficer(Applicant):
         Generate a booking receipt if applicant’s application is 'Booked'.
         """
         for app in applicant.applications:
-            if app.applicationStatus == "Booked":
+            if app.applicationStatus == Status.BOOKED:
                 print("======== FLAT BOOKING RECEIPT ========")
                 print(f"Applicant Name: {applicant.name}")
                 print(f"NRIC: {applicant.userID}")
@@ -277,15 +312,21 @@ class HDBManager(User):
     """
     HDBManager extends User.
     """
+    __slots__ = ("projects_handling", "pending_officer_regs")
+
     def __init__(self, user_id, password, age, marital_status, name):
         super().__init__(user_id, password, age, marital_status, name)
         self.projects_handling = []
+        # HDBOfficer -> None for registrations awaiting this manager (ordered set).
+        self.pending_officer_regs = {}
 
-    def createBTOProject(self, name, neighborhood, flat_types, open_date, close_date, slot):
-        return BTOProject(name, neighborhood, flat_types, open_date, close_date, self, slot)
+    def createBTOProject(self, name, neighborhood, units_2, price_2, units_3, price_3,
+                         open_date, close_date, slot):
+        return BTOProject(name, neighborhood, units_2, price_2, units_3, price_3,
+                          open_date, close_date, self, slot)
 
     def editBTOProject(self, project, new_name=None, new_neighborhood=None, new_flat_types=None):
-        if project.manager != self:
+        if project.manager is not self:
             print("You are not the manager of this project.")
             return
         if new_name:
@@ -297,33 +338,33 @@ class HDBManager(User):
         print(f"Project '{project.projectName}' updated successfully.")
 
     def toggleProjectVisibility(self, project, isVisible):
-        if project.manager != self:
+        if project.manager is not self:
             print("You are not the manager of this project.")
             return
         project.visibility = isVisible
         print(f"Project '{project.projectName}' visibility set to {isVisible}.")
 
     def approveOrRejectApplication(self, application, decision):
-        if application.BTOProject.manager != self:
+        if application.BTOProject.manager is not self:
             print("You are not the manager of this project.")
             return
-        if application.applicationStatus != "Pending":
+        if application.applicationStatus != Status.PENDING:
             print("This application is not Pending. Cannot approve/reject.")
             return
 
         if decision:
             ft = application.chosen_flat_type
-            if application.BTOProject.flatTypes[ft]["units"] > 0:
-                application.updateStatus("Successful")
+            if application.BTOProject.units(ft) > 0:
+                application.updateStatus(Status.SUCCESSFUL)
                 print(f"Application for {application.applicant.name} approved.")
             else:
                 print("Not enough units left for that flat type! Cannot approve.")
         else:
-            application.updateStatus("Unsuccessful")
+            application.updateStatus(Status.UNSUCCESSFUL)
             print(f"Application for {application.applicant.name} rejected.")
 
     def approveOrRejectWithdrawal(self, application, decision):
-        if application.BTOProject.manager != self:
+        if application.BTOProject.manager is not self:
             print("You are not the manager of this project.")
             return
         if not application.requested_withdrawal:
@@ -331,8 +372,8 @@ class HDBManager(User):
             return
 
         if decision:
-            if application.applicationStatus in ["Pending","Successful"]:
-                application.updateStatus("Unsuccessful")
+            if application.applicationStatus in _ACTIVE_STATUSES:
+                application.updateStatus(Status.UNSUCCESSFUL)
                 application.requested_withdrawal = False
                 print("Withdrawal approved. Application set to 'Unsuccessful'.")
             else:
@@ -346,10 +387,10 @@ class HDBManager(User):
             print("Officer has no project registration pending.")
             return
         project = officer.registered_project
-        if project.manager != self:
+        if project.manager is not self:
             print("You are not the manager of this project.")
             return
-        if officer.registration_status != "Pending":
+        if officer.registration_status != PENDING:
             print("Officer's registration is not pending.")
             return
 
@@ -357,120 +398,245 @@ class HDBManager(User):
             if len(project.officers) >= project.officerSlot:
                 print("No more officer slots available.")
                 return
-            project.officers.append(officer)
+            project.officers[officer.userID] = officer
             officer.handling_project = project
-            officer.registration_status = "Approved"
+            officer.registration_status = APPROVED
+            self.pending_officer_regs.pop(officer, None)
             print(f"Officer {officer.name} approved for '{project.projectName}'.")
         else:
-            officer.registration_status = "Rejected"
+            officer.registration_status = REJECTED
+            self.pending_officer_regs.pop(officer, None)
             print(f"Officer {officer.name} rejected for '{project.projectName}'.")
 
     def generateApplicantReport(self, applications):
-        print("=== Applicant Report (Booked Applications) ===")
-        for app in applications:
-            if app.applicationStatus == "Booked":
-                print(f"Applicant: {app.applicant.name} ({app.applicant.userID}) | "
-                      f"Age: {app.applicant.age} | Marital: {app.applicant.marital_status} | "
-                      f"Project: {app.BTOProject.projectName} | Flat Type: {app.chosen_flat_type}")
+        lines = ["=== Applicant Report (Booked Applications) ==="]
+        lines.extend(f"Applicant: {app.applicant.name} ({app.applicant.userID}) | "
+                     f"Age: {app.applicant.age} | Marital: {app.applicant.marital_status} | "
+                     f"Project: {app.BTOProject.projectName} | Flat Type: {app.chosen_flat_type}"
+                     for app in applications if app.applicationStatus == Status.BOOKED)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class BTOProject:
+    __slots__ = ("projectID", "projectName", "neighborhood",
+                 "units_2", "price_2", "units_3", "price_3", "flatTypeOrder",
+                 "applicationOpenDate", "applicationCloseDate",
+                 "manager", "officers", "visibility", "officerSlot")
+
     project_counter = 1
 
-    def __init__(self, project_name, neighborhood, flat_types,
-                 open_date, close_date, manager, officerSlot):
+    def __init__(self, project_name, neighborhood, units_2, price_2, units_3, price_3,
+                 open_date, close_date, manager, officerSlot, flat_type_order=(FT2, FT3)):
         self.projectID = BTOProject.project_counter
         BTOProject.project_counter += 1
         self.projectName = project_name
         self.neighborhood = neighborhood
-        self.flatTypes = flat_types
+        # Only 2-Room and 3-Room exist, so they are stored as plain attributes.
+        # flatTypeOrder lists the types this project offers, in display order;
+        # the attributes of a type it does not offer stay at 0.
+        self.units_2 = units_2
+        self.price_2 = price_2
+        self.units_3 = units_3
+        self.price_3 = price_3
+        self.flatTypeOrder = tuple(flat_type_order)
         self.applicationOpenDate = open_date
         self.applicationCloseDate = close_date
         self.manager = manager
-        self.officers = []
+        self.officers = {}   # userID -> HDBOfficer
         self.visibility = True
         self.officerSlot = officerSlot
 
+    @property
+    def flatTypes(self):
+        """Dict view {flat type: {"units", "price"}}; assigning one updates the attributes."""
+        return {ft: {"units": self.units(ft), "price": self.price(ft)}
+                for ft in self.flatTypeOrder}
+
+    @flatTypes.setter
+    def flatTypes(self, flat_types):
+        if FT2 in flat_types:
+            self.units_2 = flat_types[FT2]["units"]
+            self.price_2 = flat_types[FT2]["price"]
+        if FT3 in flat_types:
+            self.units_3 = flat_types[FT3]["units"]
+            self.price_3 = flat_types[FT3]["price"]
+        self.flatTypeOrder += tuple(ft for ft in flat_types
+                                    if ft in (FT2, FT3) and ft not in self.flatTypeOrder)
+
+    def units(self, flat_type):
+        if flat_type == FT2:
+            return self.units_2
+        if flat_type == FT3:
+            return self.units_3
+        return 0
+
+    def price(self, flat_type):
+        if flat_type == FT2:
+            return self.price_2
+        if flat_type == FT3:
+            return self.price_3
+        return 0
+
+    def isOpenOn(self, today):
+        """True if applications are open on `today`; always open when either date is unknown."""
+        if not (self.applicationOpenDate and self.applicationCloseDate):
+            return True
+        return self.applicationOpenDate <= today <= self.applicationCloseDate
+
     def toggleVisibility(self, isVisible):
         self.visibility = isVisible
 
     def registerHDBOfficer(self, officer):
+        if officer.userID in self.officers:
+            return
         if len(self.officers) < self.officerSlot:
-            self.officers.append(officer)
+            self.officers[officer.userID] = officer
         else:
             print("No slots left for this project.")
 
     def reduceUnits(self, flat_type, num):
-        if flat_type in self.flatTypes:
-            self.flatTypes[flat_type]["units"] -= num
-            if self.flatTypes[flat_type]["units"] < 0:
-                self.flatTypes[flat_type]["units"] = 0
+        if flat_type == FT2:
+            self.units_2 = max(0, self.units_2 - num)
+        elif flat_type == FT3:
+            self.units_3 = max(0, self.units_3 - num)
+
+    def infoBlock(self):
+        """Project details as a single string, ending with a blank line."""
+        lines = [f"[ProjectID={self.projectID}] {self.projectName} | Neighborhood: {self.neighborhood} | Visible: {self.visibility}"]
+        if self.applicationOpenDate and self.applicationCloseDate:
+            lines.append(f"   Application Period: {self.applicationOpenDate} to {self.applicationCloseDate}")
+        lines.extend(f"   {ft}: {self.units(ft)} units, Price: {self.price(ft)}"
+                     for ft in self.flatTypeOrder)
+        return "\n".join(lines) + "\n\n"
 
     def displayInfo(self):
-        print(f"[ProjectID={self.projectID}] {self.projectName} | Neighborhood: {self.neighborhood} | Visible: {self.visibility}")
-        if self.applicationOpenDate and self.applicationCloseDate:
-            print(f"   Application Period: {self.applicationOpenDate} to {self.applicationCloseDate}")
-        for ft, info in self.flatTypes.items():
-            print(f"   {ft}: {info['units']} units, Price: {info['price']}")
-        print()
+        sys.stdout.write(self.infoBlock())
 
 
 class Application:
     """
     BTO Application linking Applicant to Project
     """
+    __slots__ = ("applicationID", "applicant", "BTOProject", "applicationStatus",
+                 "chosen_flat_type", "_requested_withdrawal", "_controller")
+
+    application_counter = 1
+
     def __init__(self, applicant, BTOProject, chosen_flat_type):
+        self.applicationID = Application.application_counter
+        Application.application_counter += 1
         self.applicant = applicant
         self.BTOProject = BTOProject
-        self.applicationStatus = "Pending"
+        self.applicationStatus = Status.PENDING
         self.chosen_flat_type = chosen_flat_type
-        self.requested_withdrawal = False
+        self._requested_withdrawal = False
+        self._controller = None   # set by ApplicationController.createApplication
+
+    @property
+    def requested_withdrawal(self):
+        return self._requested_withdrawal
+
+    @requested_withdrawal.setter
+    def requested_withdrawal(self, requested):
+        self._requested_withdrawal = requested
+        if self._controller:
+            self._controller.reindex(self)
+
+    @property
+    def display(self):
+        return (f"Applicant: {self.applicant.name}, "
+                f"Project: {self.BTOProject.projectName}, "
+                f"Flat: {self.chosen_flat_type}")
 
     def updateStatus(self, new_status):
         self.applicationStatus = new_status
+        if self._controller:
+            self._controller.reindex(self)
 
 
 class Inquiry:
     """
     Inquiry from Applicant.
     """
+    __slots__ = ("applicant", "officer", "message", "response", "_iid", "replyLine")
+
     def __init__(self, applicant, officer, message):
         self.applicant = applicant
         self.officer = officer
         self.message = message
         self.response = None
+        self._iid = None
+        self._refreshReplyLine()
+
+    def _refreshReplyLine(self):
+        # replyLine is the listing line for the manager reply menu; reply() rebuilds it.
+        self.replyLine = f"From {self.applicant.name}: {self.message} (response: {self.response})"
 
     def reply(self, response):
         self.response = response
+        self._refreshReplyLine()
 
 
 class ApplicationController:
     def __init__(self):
-        self.applications = []
+        self.applications = {}    # applicationID -> Application, in creation order
+        self._idx = {}            # (projectID, NRIC) -> first Application
+        # HDBManager -> {Application: None}, used as sets. Pending entries are
+        # only ever added at creation, so they stay in creation order; a
+        # withdrawal can be re-requested, so list those via sorted by ID.
+        self.pending_by_manager = {}
+        self.withdrawals_by_manager = {}
 
     def createApplication(self, app):
-        self.applications.append(app)
+        self.applications[app.applicationID] = app
+        nric = app.applicant.userID
+        self._idx.setdefault((app.BTOProject.projectID, nric), app)
+        app._controller = self
+        self.reindex(app)
+
+    def reindex(self, app):
+        """Sync app's entries in the per-manager pending/withdrawal indexes."""
+        manager = app.BTOProject.manager
+        pending = self.pending_by_manager.setdefault(manager, {})
+        if app.applicationStatus == Status.PENDING:
+            pending[app] = None
+        else:
+            pending.pop(app, None)
+        withdrawals = self.withdrawals_by_manager.setdefault(manager, {})
+        if app.requested_withdrawal:
+            withdrawals[app] = None
+        else:
+            withdrawals.pop(app, None)
 
     def findApplicationByNRIC_Project(self, nric, project):
-        for app in self.applications:
-            if app.applicant.userID == nric and app.BTOProject == project:
-                return app
-        return None
+        return self._idx.get((project.projectID, nric))
 
 
 class InquiryController:
     def __init__(self):
-        self.inquiries = []
+        self.inquiries = {}   # inquiry ID -> Inquiry, in creation order
+        self._next = 0
+        # getAllInquiries() result, rebuilt only after the set of inquiries changes.
+        self._version = 0
+        self._cached_all = None
+        self._cached_version = -1
 
     def createInquiry(self, inquiry):
-        self.inquiries.append(inquiry)
+        inquiry._iid = self._next
+        self.inquiries[self._next] = inquiry
+        self._next += 1
+        self._version += 1
 
     def deleteInquiry(self, inquiry):
-        if inquiry in self.inquiries:
-            self.inquiries.remove(inquiry)
+        if self.inquiries.pop(inquiry._iid, None) is not None:
+            self._version += 1
 
     def getAllInquiries(self):
-        return self.inquiries
+        """Return all inquiries in creation order. The list is shared; do not mutate it."""
+        if self._cached_version != self._version:
+            self._cached_all = list(self.inquiries.values())
+            self._cached_version = self._version
+        return self._cached_all
 
     def replyInquiry(self, inquiry, response):
         inquiry.reply(response)
@@ -479,112 +645,550 @@ class InquiryController:
 class ProjectController:
     def __init__(self):
         self.projects = []
+        self._by_id = {}
 
     def addProject(self, project):
         self.projects.append(project)
+        self._by_id[project.projectID] = project
 
     def findProjectByID(self, pid):
-        for p in self.projects:
-            if p.projectID == pid:
-                return p
-        return None
+        return self._by_id.get(pid)
 
 
+@lru_cache(maxsize=1024)
 def parse_date(date_str):
     """Expect YYYY-MM-DD. Return date or None if invalid."""
+    # fromisoformat is the fast path, but only for the padded YYYY-MM-DD shape:
+    # on 3.11+ it also takes forms like 20250215 and 2025-W07-6, which the
+    # "%Y-%m-%d" format rejects.
+    if len(date_str) == 10 and date_str[4] == date_str[7] == '-':
+        try:
+            return datetime.date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    # strptime also accepts unpadded fields such as 2025-2-5.
     try:
         return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-    except:
+    except ValueError:
         return None
 
+_USER_COLUMNS = ("NRIC", "Password", "Age", "Marital Status", "Name")
+
+def _load_users(filename, user_cls):
+    """Load rows of a user CSV -> List[user_cls]."""
+    with open(filename, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        i_nric, i_pw, i_age, i_status, i_name = (header.index(k) for k in _USER_COLUMNS)
+        return [user_cls(row[i_nric], row[i_pw], int(row[i_age]), row[i_status], row[i_name])
+                for row in reader if row]
+
 def load_applicants(filename):
     """Load Applicant data from CSV -> List[Applicant]."""
-    applicants = []
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = row["Name"]
-            nric = row["NRIC"]
-            age = int(row["Age"])
-            m_status = row["Marital Status"]
-            password = row["Password"]
-            applicants.append(Applicant(nric, password, age, m_status, name))
-    return applicants
+    return _load_users(filename, Applicant)
 
 def load_managers(filename):
     """Load HDBManager data from CSV -> List[HDBManager]."""
-    managers = []
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = row["Name"]
-            nric = row["NRIC"]
-            age = int(row["Age"])
-            m_status = row["Marital Status"]
-            password = row["Password"]
-            managers.append(HDBManager(nric, password, age, m_status, name))
-    return managers
+    return _load_users(filename, HDBManager)
 
 def load_officers(filename):
     """
     Load HDBOfficer data from CSV -> List[HDBOfficer].
     Note that HDBOfficer extends Applicant in this code.
     """
-    officers = []
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = row["Name"]
-            nric = row["NRIC"]
-            age = int(row["Age"])
-            m_status = row["Marital Status"]
-            password = row["Password"]
-            officers.append(HDBOfficer(nric, password, age, m_status, name))
-    return officers
+    return _load_users(filename, HDBOfficer)
+
+_PROJECT_COLUMNS = (
+    "Project Name", "Neighborhood",
+    "Type 1", "Number of units for Type 1", "Selling price for Type 1",
+    "Type 2", "Number of units for Type 2", "Selling price for Type 2",
+    "Application opening date", "Application closing date",
+    "Manager", "Officer Slot", "Officer",
+)
 
 def load_projects(filename, manager_list, officer_list):
     projects = []
+    # Managers/officers are referenced by name or NRIC in the CSV. setdefault
+    # keeps the first manager in list order for each key; every officer whose
+    # name or NRIC matches is kept, in list order, as the original scans did.
+    mgr_idx = {}
+    for m in manager_list:
+        mgr_idx.setdefault(m.name, m)
+        mgr_idx.setdefault(m.userID, m)
+    off_idx = {}
+    for off in officer_list:
+        off_idx.setdefault(off.name, []).append(off)
+        if off.userID != off.name:
+            off_idx.setdefault(off.userID, []).append(off)
     with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return projects
+        (i_name, i_nbhd,
+         i_t1, i_t1_units, i_t1_price,
+         i_t2, i_t2_units, i_t2_price,
+         i_open, i_close,
+         i_manager, i_slot, i_officer) = (header.index(k) for k in _PROJECT_COLUMNS)
         for row in reader:
-            pname = row["Project Name"]
-            neighborhood = row["Neighborhood"]
-            t1 = row["Type 1"]
-            t1_units = int(row["Number of units for Type 1"])
-            t1_price = int(row["Selling price for Type 1"])
-            t2 = row["Type 2"]
-            t2_units = int(row["Number of units for Type 2"])
-            t2_price = int(row["Selling price for Type 2"])
-            open_date = parse_date(row["Application opening date"])
-            close_date = parse_date(row["Application closing date"])
-            manager_str = row["Manager"]
-            slot = int(row["Officer Slot"])
-            officer_str = row["Officer"]
-
-            manager_obj = None
-            for m in manager_list:
-                if m.name == manager_str or m.userID == manager_str:
-                    manager_obj = m
-                    break
-
-            ft_dict = {
-                t1: {"units": t1_units, "price": t1_price},
-                t2: {"units": t2_units, "price": t2_price}
-            }
-            new_project = BTOProject(pname, neighborhood, ft_dict, open_date, close_date, manager_obj, slot)
+            if not row:
+                continue
+            pname = row[i_name]
+            neighborhood = row[i_nbhd]
+            t1 = sys.intern(row[i_t1])
+            t1_units = int(row[i_t1_units])
+            t1_price = int(row[i_t1_price])
+            t2 = sys.intern(row[i_t2])
+            t2_units = int(row[i_t2_units])
+            t2_price = int(row[i_t2_price])
+            open_date = parse_date(row[i_open])
+            close_date = parse_date(row[i_close])
+            manager_str = row[i_manager]
+            slot = int(row[i_slot])
+            officer_str = row[i_officer]
+
+            manager_obj = mgr_idx.get(manager_str)
+
+            offered = {}   # flat type -> (units, price), in CSV column order
+            for ft, ft_units, ft_price in ((t1, t1_units, t1_price), (t2, t2_units, t2_price)):
+                if ft in (FT2, FT3):
+                    offered[ft] = (ft_units, ft_price)
+                else:
+                    print(f"Warning: project '{pname}' has unsupported flat type '{ft}'; ignored.")
+            units_2, price_2 = offered.get(FT2, (0, 0))
+            units_3, price_3 = offered.get(FT3, (0, 0))
+            new_project = BTOProject(pname, neighborhood, units_2, price_2, units_3, price_3,
+                                     open_date, close_date, manager_obj, slot,
+                                     flat_type_order=tuple(offered))
 
             if officer_str.strip():
                 off_names = [o.strip() for o in officer_str.split(",")]
-                for oname in off_names:
-                    for off in officer_list:
-                        if off.name == oname or off.userID == oname:
-                            new_project.officers.append(off)
-                            off.handling_project = new_project
-                            off.registration_status = "Approved"
+                for off in [off for o in off_names for off in off_idx.get(o, ())]:
+                    new_project.officers[off.userID] = off
+                    off.handling_project = new_project
+                    off.registration_status = APPROVED
             projects.append(new_project)
     return projects
 
 
+# Menu texts include their trailing newline and are written with one
+# sys.stdout.write per render.
+LOGIN_MENU_TEXT = "\n1. Login\n0. Exit\n"
+
+APPLICANT_MENU_TEXT = "\n".join([
+    "\nApplicant Menu",
+    "1. View All Projects",
+    "2. Apply for a Project",
+    "3. View Application Status",
+    "4. Request Application Withdrawal",
+    "5. Submit Enquiry",
+    "6. View My Enquiries",
+    "7. Delete an Enquiry",
+    "8. Change Password",
+    "9. Logout",
+    "",
+])
+
+OFFICER_MENU_TEXT = "\n".join([
+    "\nHDB Officer Menu",
+    "1. View All Projects",
+    "2. Apply for a Project",
+    "3. View My Application Status",
+    "4. Request Application Withdrawal",
+    "5. Submit Enquiry",
+    "6. View My Enquiries",
+    "7. Delete an Enquiry",
+    "8. Register to handle a Project",
+    "9. View an Applicant's Status in My Project",
+    "10. Update Flat Availability",
+    "11. Retrieve an Application by NRIC",
+    "12. Generate Booking Receipt",
+    "13. Change Password",
+    "14. Logout",
+    "",
+])
+
+MANAGER_MENU_TEXT = "\n".join([
+    "\nHDB Manager Menu",
+    "1. View All Projects",
+    "2. Create BTO Project",
+    "3. Edit BTO Project",
+    "4. Toggle Project Visibility",
+    "5. Approve/Reject Application",
+    "6. Approve/Reject Withdrawal Request",
+    "7. Approve/Reject Officer Registration",
+    "8. Generate Applicant Report (Booked)",
+    "9. View All Enquiries",
+    "10. Reply to an Enquiry",
+    "11. Change Password",
+    "12. Logout",
+    "",
+])
+
+
+class MenuContext:
+    """Session state (logged-in user, today's date) plus the controllers and
+    lookups shared by the menu handlers."""
+    __slots__ = ("app_controller", "inq_controller", "proj_controller",
+                 "applicants_by_nric", "today", "current_user")
+
+    def __init__(self, app_controller, inq_controller, proj_controller, applicants_by_nric):
+        self.app_controller = app_controller
+        self.inq_controller = inq_controller
+        self.proj_controller = proj_controller
+        self.applicants_by_nric = applicants_by_nric
+        self.today = datetime.date.today()
+        self.current_user = None
+
+
+def _parse_id(s):
+    """Parse a non-negative integer ID from user input; None if invalid.
+
+    Only decimal digits are accepted: no sign, whitespace or '_' separators.
+    """
+    return int(s) if s.isdecimal() else None
+
+def _logout(u, ctx):
+    ctx.current_user = None
+
+def _invalid_choice():
+    print("Invalid choice.")
+
+def _view_projects(u, ctx):
+    u.viewProjects(ctx.proj_controller.projects)
+
+def _view_application_status(u, ctx):
+    u.viewApplicationStatus()
+
+def _request_withdrawal(u, ctx):
+    u.requestWithdrawal()
+
+def _view_enquiries(u, ctx):
+    u.viewEnquiries()
+
+def _delete_enquiry(u, ctx):
+    u.deleteEnquiry(ctx.inq_controller)
+
+def _change_password(u, ctx):
+    new_pw = input("Enter new password: ")
+    u.changePassword(new_pw)
+
+def _apply_for_project(u, ctx, check_visibility):
+    pid = _parse_id(input("Enter Project ID to apply: "))
+    if pid is None:
+        print("Invalid project ID.")
+        return
+    project = ctx.proj_controller.findProjectByID(pid)
+    if not project:
+        print("Project not found.")
+        return
+    if check_visibility and not project.visibility:
+        print("Project is not visible.")
+        return
+    if not project.isOpenOn(ctx.today):
+        print("Not within application period.")
+        return
+    ft_input = input("Enter flat type (2 or 3): ")
+    ft_converted = FLAT_TYPE_MAP.get(ft_input)
+    if not ft_converted:
+        print("Invalid flat type choice.")
+        return
+    u.applyForProject(project, ft_converted, ctx.app_controller)
+
+# ---- Applicant handlers ----
+def _applicant_submit_enquiry(u, ctx):
+    msg = input("Enter enquiry: ")
+    u.submitEnquiry(msg, ctx.inq_controller)
+
+# ---- Officer handlers ----
+def _officer_submit_enquiry(u, ctx):
+    msg = input("Enter your enquiry: ")
+    u.submitEnquiry(msg, ctx.inq_controller)
+
+def _officer_register(u, ctx):
+    pid = _parse_id(input("Enter Project ID to register as Officer: "))
+    if pid is None:
+        print("Invalid project ID.")
+        return
+    project = ctx.proj_controller.findProjectByID(pid)
+    if not project:
+        print("Project not found.")
+        return
+    u.registerToProject(project)
+
+def _officer_view_applicant_status(u, ctx):
+    anric = input("Enter Applicant NRIC: ")
+    found_applicant = ctx.applicants_by_nric.get(anric)
+    if found_applicant:
+        u.viewApplicantStatusInProject(found_applicant)
+    else:
+        print("Applicant not found.")
+
+def _officer_update_flat_availability(u, ctx):
+    if not u.handling_project:
+        print("You are not currently assigned to any project.")
+        return
+    ft_input = input("Enter flat type to update (2 or 3): ")
+    ft_converted = FLAT_TYPE_MAP.get(ft_input)
+    if not ft_converted:
+        print("Invalid flat type choice.")
+        return
+    num = input("Enter number of units booked: ")
+    try:
+        nb = int(num)
+        u.updateFlatAvailability(u.handling_project, ft_converted, nb)
+    except ValueError:
+        print("Invalid number.")
+
+def _officer_retrieve_application(u, ctx):
+    anric = input("Enter Applicant NRIC: ")
+    u.retrieveApplication(anric, ctx.app_controller)
+
+def _officer_generate_receipt(u, ctx):
+    anric = input("Enter Applicant NRIC to generate receipt: ")
+    found_applicant = ctx.applicants_by_nric.get(anric)
+    if found_applicant:
+        u.generateReceipt(found_applicant)
+    else:
+        print("Applicant not found.")
+
+# ---- Manager handlers ----
+def _manager_create_project(u, ctx):
+    pname = input("Project name: ")
+    nbhd = input("Neighborhood: ")
+    t1_units = input("Number of 2-Room units: ")
+    t1_price = input("Selling price for 2-Room: ")
+    t2_units = input("Number of 3-Room units: ")
+    t2_price = input("Selling price for 3-Room: ")
+    open_d = input("Open date (YYYY-MM-DD): ")
+    close_d = input("Close date (YYYY-MM-DD): ")
+    slot = input("Officer slots (max 10): ")
+    try:
+        t1u = int(t1_units)
+        t1p = int(t1_price)
+        t2u = int(t2_units)
+        t2p = int(t2_price)
+        s = int(slot)
+        od = parse_date(open_d)
+        cd = parse_date(close_d)
+        new_p = u.createBTOProject(pname, nbhd, t1u, t1p, t2u, t2p, od, cd, s)
+        ctx.proj_controller.addProject(new_p)
+        u.projects_handling.append(new_p)
+        print(f"Project '{pname}' created.")
+    except ValueError:
+        print("Invalid numeric input.")
+
+def _manager_edit_project(u, ctx):
+    pid = _parse_id(input("Project ID to edit: "))
+    if pid is None:
+        print("Invalid project ID.")
+        return
+    proj = ctx.proj_controller.findProjectByID(pid)
+    if not proj:
+        print("Project not found.")
+        return
+    new_name = input("New project name (blank to skip): ")
+    new_nbhd = input("New neighborhood (blank to skip): ")
+    u.editBTOProject(proj,
+                     new_name if new_name else None,
+                     new_nbhd if new_nbhd else None,
+                     None)
+
+def _manager_toggle_visibility(u, ctx):
+    pid = _parse_id(input("Project ID to toggle: "))
+    if pid is None:
+        print("Invalid project ID.")
+        return
+    proj = ctx.proj_controller.findProjectByID(pid)
+    if not proj:
+        print("Project not found.")
+        return
+    vis = input("Set visibility (1 for True, 0 for False): ")
+    if vis == '1':
+        u.toggleProjectVisibility(proj, True)
+    else:
+        u.toggleProjectVisibility(proj, False)
+
+def _manager_review_applications(u, ctx):
+    pending = ctx.app_controller.pending_by_manager.get(u)
+    if not pending:
+        print("No pending apps for your projects.")
+        return
+    pending_apps = list(pending)
+    sys.stdout.write("Pending Applications:\n"
+                     + "\n".join(f"{i}. {a.display}"
+                                 for i, a in enumerate(pending_apps, start=1))
+                     + "\n")
+    c = input("Select an application to approve/reject: ")
+    try:
+        idx = int(c) - 1
+    except ValueError:
+        print("Invalid input.")
+        return
+    if not 0 <= idx < len(pending_apps):
+        print("Invalid choice.")
+        return
+    sel_app = pending_apps[idx]
+    d = input("Approve or Reject? (1 for Approve, 0 for Reject): ")
+    decision = (d == '1')
+    u.approveOrRejectApplication(sel_app, decision)
+
+def _manager_review_withdrawals(u, ctx):
+    withdrawals = ctx.app_controller.withdrawals_by_manager.get(u)
+    if not withdrawals:
+        print("No withdrawal requests.")
+        return
+    w_apps = sorted(withdrawals, key=lambda a: a.applicationID)   # creation order
+    sys.stdout.write("Withdrawal Requests:\n"
+                     + "\n".join(f"{i}. {a.applicant.name}, Project: {a.BTOProject.projectName}, "
+                                 f"Status: {a.applicationStatus}"
+                                 for i, a in enumerate(w_apps, start=1))
+                     + "\n")
+    c = input("Select to approve/reject: ")
+    try:
+        idx = int(c) - 1
+    except ValueError:
+        print("Invalid input.")
+        return
+    if not 0 <= idx < len(w_apps):
+        print("Invalid choice.")
+        return
+    sel_app = w_apps[idx]
+    d = input("Approve or Reject? (1 for Approve, 0 for Reject): ")
+    decision = (d == '1')
+    u.approveOrRejectWithdrawal(sel_app, decision)
+
+def _manager_review_officers(u, ctx):
+    if not u.pending_officer_regs:
+        print("No pending officer registrations.")
+        return
+    pending_officers = sorted(u.pending_officer_regs, key=lambda o: o.loadOrder)   # load order
+    sys.stdout.write("Pending Officer Registrations:\n"
+                     + "\n".join(f"{i}. Officer: {o.name}, Project: {o.registered_project.projectName}"
+                                 for i, o in enumerate(pending_officers, start=1))
+                     + "\n")
+    c = input("Select to approve/reject: ")
+    try:
+        idx = int(c) - 1
+    except ValueError:
+        print("Invalid input.")
+        return
+    if not 0 <= idx < len(pending_officers):
+        print("Invalid choice.")
+        return
+    sel_off = pending_officers[idx]
+    d = input("Approve or Reject? (1 for Approve, 0 for Reject): ")
+    decision = (d == '1')
+    u.approveOrRejectHDBOfficerRegistration(sel_off, decision)
+
+def _manager_report(u, ctx):
+    u.generateApplicantReport(ctx.app_controller.applications.values())
+
+def _manager_view_enquiries(u, ctx):
+    all_inqs = ctx.inq_controller.getAllInquiries()
+    if not all_inqs:
+        print("No enquiries.")
+        return
+    lines = []
+    for i, enq in enumerate(all_inqs, start=1):
+        lines.append(f"{i}. From {enq.applicant.name}: {enq.message}")
+        if enq.response:
+            lines.append(f"   Response: {enq.response}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _manager_reply_enquiry(u, ctx):
+    all_inqs = ctx.inq_controller.getAllInquiries()
+    if not all_inqs:
+        print("No enquiries to reply to.")
+        return
+    sys.stdout.write("\n".join(f"{i}. {enq.replyLine}"
+                               for i, enq in enumerate(all_inqs, start=1))
+                     + "\n")
+    c = input("Select an enquiry to reply: ")
+    try:
+        idx = int(c) - 1
+    except ValueError:
+        print("Invalid input.")
+        return
+    if not 0 <= idx < len(all_inqs):
+        print("Invalid choice.")
+        return
+    sel_enq = all_inqs[idx]
+    resp = input("Enter reply: ")
+    ctx.inq_controller.replyInquiry(sel_enq, resp)
+    print("Replied successfully.")
+
+
+# Each maps a menu choice to a handler taking (current user, MenuContext).
+APPLICANT_HANDLERS = {
+    '1': _view_projects,
+    '2': lambda u, ctx: _apply_for_project(u, ctx, check_visibility=True),
+    '3': _view_application_status,
+    '4': _request_withdrawal,
+    '5': _applicant_submit_enquiry,
+    '6': _view_enquiries,
+    '7': _delete_enquiry,
+    '8': _change_password,
+    '9': _logout,
+}
+OFFICER_HANDLERS = {
+    '1': _view_projects,
+    '2': lambda u, ctx: _apply_for_project(u, ctx, check_visibility=False),
+    '3': _view_application_status,
+    '4': _request_withdrawal,
+    '5': _officer_submit_enquiry,
+    '6': _view_enquiries,
+    '7': _delete_enquiry,
+    '8': _officer_register,
+    '9': _officer_view_applicant_status,
+    '10': _officer_update_flat_availability,
+    '11': _officer_retrieve_application,
+    '12': _officer_generate_receipt,
+    '13': _change_password,
+    '14': _logout,
+}
+MANAGER_HANDLERS = {
+    '1': _view_projects,
+    '2': _manager_create_project,
+    '3': _manager_edit_project,
+    '4': _manager_toggle_visibility,
+    '5': _manager_review_applications,
+    '6': _manager_review_withdrawals,
+    '7': _manager_review_officers,
+    '8': _manager_report,
+    '9': _manager_view_enquiries,
+    '10': _manager_reply_enquiry,
+    '11': _change_password,
+    '12': _logout,
+}
+
+# Role -> (menu text, handler table). Keyed on the exact class so that
+# HDBOfficer does not fall through to the Applicant menu.
+_ROLE_MENUS = {
+    Applicant: (APPLICANT_MENU_TEXT, APPLICANT_HANDLERS),
+    HDBOfficer: (OFFICER_MENU_TEXT, OFFICER_HANDLERS),
+    HDBManager: (MANAGER_MENU_TEXT, MANAGER_HANDLERS),
+}
+
+def _run_menu(user, ctx, menu_text, handlers):
+    """Serve one role's menu until the user logs out."""
+    # Bind per-tick callables to locals once for the loop below.
+    _write = sys.stdout.write
+    _input = input
+    _today = datetime.date.today
+    _get_handler = handlers.get
+    while ctx.current_user is user:
+        ctx.today = _today()
+        _write(menu_text)
+        handler = _get_handler(_input("Choice: "))
+        if handler:
+            handler(user, ctx)
+        else:
+            _invalid_choice()
+
+
 def main():
     print("=== HDB BTO Application System (Python) ===")
 
@@ -605,425 +1209,45 @@ def main():
             p.manager.projects_handling.append(p)
 
     all_users = applicants + managers + officers
+    # NRIC -> users with that NRIC, in load order; login takes the first
+    # whose password matches, as the original linear scan did.
+    users_by_id = {}
+    for u in all_users:
+        users_by_id.setdefault(u.userID, []).append(u)
+    applicants_by_nric = {}
+    for a in applicants:
+        applicants_by_nric.setdefault(a.userID, a)   # first match, like the old scan
+    ctx = MenuContext(app_controller, inq_controller, proj_controller, applicants_by_nric)
 
     def login():
         nric = input("Enter NRIC: ")
         pw = input("Enter Password: ")
-        for user in all_users:
-            if user.userID == nric and user.password == pw:
-                return user
-        return None
-
-    def convert_flat_input(user_input):
-        if user_input == '2':
-            return "2-Room"
-        elif user_input == '3':
-            return "3-Room"
-        else:
-            return None
+        return next((u for u in users_by_id.get(nric, ()) if u.password == pw), None)
 
+    _write = sys.stdout.write
+    _input = input
+    _print = print
     while True:
-        if not globals().get('current_user'):
-            print("\n1. Login")
-            print("0. Exit")
-            choice = input("Choice: ")
-            if choice == '1':
-                user = login()
-                if user:
-                    globals()['current_user'] = user
-                    print(f"Welcome, {user.name} ({user.__class__.__name__})!")
-                else:
-                    print("Invalid NRIC or password.")
-            elif choice == '0':
-                print("Goodbye!")
-                break
-            else:
-                print("Invalid choice.")
+        _write(LOGIN_MENU_TEXT)
+        choice = _input("Choice: ")
+        if choice == '1':
+            user = login()
+            if not user:
+                _print("Invalid NRIC or password.")
+                continue
+            ctx.current_user = user
+            _print(f"Welcome, {user.name} ({user.__class__.__name__})!")
+            menu = _ROLE_MENUS.get(type(user))
+            if menu is None:
+                _print("Unknown user type. Logging out.")
+                ctx.current_user = None
+                continue
+            _run_menu(user, ctx, *menu)
+        elif choice == '0':
+            _print("Goodbye!")
+            break
         else:
-            current_user = globals()['current_user']
-
-            if isinstance(current_user, Applicant) and not isinstance(current_user, HDBOfficer):
-                print("\nApplicant Menu")
-                print("1. View All Projects")
-                print("2. Apply for a Project")
-                print("3. View Application Status")
-                print("4. Request Application Withdrawal")
-                print("5. Submit Enquiry")
-                print("6. View My Enquiries")
-                print("7. Delete an Enquiry")
-                print("8. Change Password")
-                print("9. Logout")
-                choice = input("Choice: ")
-                
-                if choice == '1':
-                    current_user.viewProjects(proj_controller.projects)
-                elif choice == '2':
-                    pid = input("Enter Project ID to apply: ")
-                    if not pid.isdigit():
-                        print("Invalid project ID.")
-                        continue
-                    project = proj_controller.findProjectByID(int(pid))
-                    if not project:
-                        print("Project not found.")
-                        continue
-                    if not project.visibility:
-                        print("Project is not visible.")
-                        continue
-                    today = datetime.date.today()
-                    if project.applicationOpenDate and project.applicationCloseDate:
-                        if not (project.applicationOpenDate <= today <= project.applicationCloseDate):
-                            print("Not within application period.")
-                            continue
-                    ft_input = input("Enter flat type (2 or 3): ")
-                    ft_converted = convert_flat_input(ft_input)
-                    if not ft_converted:
-                        print("Invalid flat type choice.")
-                        continue
-                    current_user.applyForProject(project, ft_converted, app_controller)
-                
-                elif choice == '3':
-                    current_user.viewApplicationStatus()
-                
-                elif choice == '4':
-                    current_user.requestWithdrawal()
-                
-                elif choice == '5':
-                    msg = input("Enter enquiry: ")
-                    current_user.submitEnquiry(msg, inq_controller)
-                
-                elif choice == '6':
-                    current_user.viewEnquiries()
-                
-                elif choice == '7':
-                    current_user.deleteEnquiry(inq_controller)
-                
-                elif choice == '8':
-                    new_pw = input("Enter new password: ")
-                    current_user.changePassword(new_pw)
-                
-                elif choice == '9':
-                    globals()['current_user'] = None
-                else:
-                    print("Invalid choice.")
-
-            elif isinstance(current_user, HDBOfficer):
-                print("\nHDB Officer Menu")
-                print("1. View All Projects")
-                print("2. Apply for a Project")
-                print("3. View My Application Status")
-                print("4. Request Application Withdrawal")
-                print("5. Submit Enquiry")
-                print("6. View My Enquiries")
-                print("7. Delete an Enquiry")
-                print("8. Register to handle a Project")
-                print("9. View an Applicant's Status in My Project")
-                print("10. Update Flat Availability")
-                print("11. Retrieve an Application by NRIC")
-                print("12. Generate Booking Receipt")
-                print("13. Change Password")
-                print("14. Logout")
-                choice = input("Choice: ")
-
-                if choice == '1':
-                    current_user.viewProjects(proj_controller.projects)
-                elif choice == '2':
-                    pid = input("Enter Project ID to apply: ")
-                    if not pid.isdigit():
-                        print("Invalid project ID.")
-                        continue
-                    project = proj_controller.findProjectByID(int(pid))
-                    if not project:
-                        print("Project not found.")
-                        continue
-                    today = datetime.date.today()
-                    if project.applicationOpenDate and project.applicationCloseDate:
-                        if not (project.applicationOpenDate <= today <= project.applicationCloseDate):
-                            print("Not within application period.")
-                            continue
-                    ft_input = input("Enter flat type (2 or 3): ")
-                    ft_converted = convert_flat_input(ft_input)
-                    if not ft_converted:
-                        print("Invalid flat type choice.")
-                        continue
-                    current_user.applyForProject(project, ft_converted, app_controller)
-
-                elif choice == '3':
-                    current_user.viewApplicationStatus()
-
-                elif choice == '4':
-                    current_user.requestWithdrawal()
-
-                elif choice == '5':
-                    msg = input("Enter your enquiry: ")
-                    current_user.submitEnquiry(msg, inq_controller)
-
-                elif choice == '6':
-                    current_user.viewEnquiries()
-
-                elif choice == '7':
-                    current_user.deleteEnquiry(inq_controller)
-
-                elif choice == '8':
-                    pid = input("Enter Project ID to register as Officer: ")
-                    if not pid.isdigit():
-                        print("Invalid project ID.")
-                        continue
-                    project = proj_controller.findProjectByID(int(pid))
-                    if not project:
-                        print("Project not found.")
-                        continue
-                    current_user.registerToProject(project)
-
-                elif choice == '9':
-                    anric = input("Enter Applicant NRIC: ")
-                    found_applicant = None
-                    for a in applicants:
-                        if a.userID == anric:
-                            found_applicant = a
-                            break
-                    if found_applicant:
-                        current_user.viewApplicantStatusInProject(found_applicant)
-                    else:
-                        print("Applicant not found.")
-
-                elif choice == '10':
-                    if not current_user.handling_project:
-                        print("You are not currently assigned to any project.")
-                        continue
-                    ft_input = input("Enter flat type to update (2 or 3): ")
-                    ft_converted = convert_flat_input(ft_input)
-                    if not ft_converted:
-                        print("Invalid flat type choice.")
-                        continue
-                    num = input("Enter number of units booked: ")
-                    try:
-                        nb = int(num)
-                        current_user.updateFlatAvailability(current_user.handling_project, ft_converted, nb)
-                    except ValueError:
-                        print("Invalid number.")
-
-                elif choice == '11':
-                    anric = input("Enter Applicant NRIC: ")
-                    current_user.retrieveApplication(anric, app_controller)
-
-                elif choice == '12':
-                    anric = input("Enter Applicant NRIC to generate receipt: ")
-                    found_applicant = None
-                    for a in applicants:
-                        if a.userID == anric:
-                            found_applicant = a
-                            break
-                    if found_applicant:
-                        current_user.generateReceipt(found_applicant)
-                    else:
-                        print("Applicant not found.")
-
-                elif choice == '13':
-                    new_pw = input("Enter new password: ")
-                    current_user.changePassword(new_pw)
-
-                elif choice == '14':
-                    globals()['current_user'] = None
-                else:
-                    print("Invalid choice.")
-
-            elif isinstance(current_user, HDBManager):
-                print("\nHDB Manager Menu")
-                print("1. View All Projects")
-                print("2. Create BTO Project")
-                print("3. Edit BTO Project")
-                print("4. Toggle Project Visibility")
-                print("5. Approve/Reject Application")
-                print("6. Approve/Reject Withdrawal Request")
-                print("7. Approve/Reject Officer Registration")
-                print("8. Generate Applicant Report (Booked)")
-                print("9. View All Enquiries")
-                print("10. Reply to an Enquiry")
-                print("11. Change Password")
-                print("12. Logout")
-                choice = input("Choice: ")
-
-                if choice == '1':
-                    current_user.viewProjects(proj_controller.projects)
-
-                elif choice == '2':
-                    pname = input("Project name: ")
-                    nbhd = input("Neighborhood: ")
-                    t1_units = input("Number of 2-Room units: ")
-                    t1_price = input("Selling price for 2-Room: ")
-                    t2_units = input("Number of 3-Room units: ")
-                    t2_price = input("Selling price for 3-Room: ")
-                    open_d = input("Open date (YYYY-MM-DD): ")
-                    close_d = input("Close date (YYYY-MM-DD): ")
-                    slot = input("Officer slots (max 10): ")
-                    try:
-                        t1u = int(t1_units)
-                        t1p = int(t1_price)
-                        t2u = int(t2_units)
-                        t2p = int(t2_price)
-                        s = int(slot)
-                        od = parse_date(open_d)
-                        cd = parse_date(close_d)
-                        ft = {
-                            "2-Room": {"units": t1u, "price": t1p},
-                            "3-Room": {"units": t2u, "price": t2p}
-                        }
-                        new_p = current_user.createBTOProject(pname, nbhd, ft, od, cd, s)
-                        proj_controller.addProject(new_p)
-                        current_user.projects_handling.append(new_p)
-                        print(f"Project '{pname}' created.")
-                    except ValueError:
-                        print("Invalid numeric input.")
-
-                elif choice == '3':
-                    pid = input("Project ID to edit: ")
-                    if not pid.isdigit():
-                        print("Invalid project ID.")
-                        continue
-                    proj = proj_controller.findProjectByID(int(pid))
-                    if not proj:
-                        print("Project not found.")
-                        continue
-                    new_name = input("New project name (blank to skip): ")
-                    new_nbhd = input("New neighborhood (blank to skip): ")
-                    current_user.editBTOProject(proj, 
-                                                new_name if new_name else None,
-                                                new_nbhd if new_nbhd else None,
-                                                None)
-
-                elif choice == '4':
-                    pid = input("Project ID to toggle: ")
-                    if not pid.isdigit():
-                        print("Invalid project ID.")
-                        continue
-                    proj = proj_controller.findProjectByID(int(pid))
-                    if not proj:
-                        print("Project not found.")
-                        continue
-                    vis = input("Set visibility (1 for True, 0 for False): ")
-                    if vis == '1':
-                        current_user.toggleProjectVisibility(proj, True)
-                    else:
-                        current_user.toggleProjectVisibility(proj, False)
-
-                elif choice == '5':
-                    pending_apps = [a for a in app_controller.applications
-                                    if a.applicationStatus == "Pending"
-                                    and a.BTOProject.manager == current_user]
-                    if not pending_apps:
-                        print("No pending apps for your projects.")
-                    else:
-                        print("Pending Applications:")
-                        for i, a in enumerate(pending_apps, start=1):
-                            print(f"{i}. Applicant: {a.applicant.name}, "
-                                  f"Project: {a.BTOProject.projectName}, "
-                                  f"Flat: {a.chosen_flat_type}")
-                        c = input("Select an application to approve/reject: ")
-                        try:
-                            idx = int(c) - 1
-                            if 0 <= idx < len(pending_apps):
-                                sel_app = pending_apps[idx]
-                                d = input("Approve or Reject? (1 for Approve, 0 for Reject): ")
-                                decision = (d == '1')
-                                current_user.approveOrRejectApplication(sel_app, decision)
-                            else:
-                                print("Invalid choice.")
-                        except:
-                            print("Invalid input.")
-
-                elif choice == '6':
-                    w_apps = [a for a in app_controller.applications 
-                              if a.requested_withdrawal 
-                              and a.BTOProject.manager == current_user]
-                    if not w_apps:
-                        print("No withdrawal requests.")
-                    else:
-                        print("Withdrawal Requests:")
-                        for i, a in enumerate(w_apps, start=1):
-                            print(f"{i}. {a.applicant.name}, Project: {a.BTOProject.projectName}, Status: {a.applicationStatus}")
-                        c = input("Select to approve/reject: ")
-                        try:
-                            idx = int(c) - 1
-                            if 0 <= idx < len(w_apps):
-                                sel_app = w_apps[idx]
-                                d = input("Approve or Reject? (1 for Approve, 0 for Reject): ")
-                                decision = (d == '1')
-                                current_user.approveOrRejectWithdrawal(sel_app, decision)
-                            else:
-                                print("Invalid choice.")
-                        except:
-                            print("Invalid input.")
-
-                elif choice == '7':
-                    pending_officers = []
-                    for off in officers:
-                        if off.registered_project and off.registered_project.manager == current_user:
-                            if off.registration_status == "Pending":
-                                pending_officers.append(off)
-                    if not pending_officers:
-                        print("No pending officer registrations.")
-                    else:
-                        print("Pending Officer Registrations:")
-                        for i, o in enumerate(pending_officers, start=1):
-                            print(f"{i}. Officer: {o.name}, Project: {o.registered_project.projectName}")
-                        c = input("Select to approve/reject: ")
-                        try:
-                            idx = int(c) - 1
-                            if 0 <= idx < len(pending_officers):
-                                sel_off = pending_officers[idx]
-                                d = input("Approve or Reject? (1 for Approve, 0 for Reject): ")
-                                decision = (d == '1')
-                                current_user.approveOrRejectHDBOfficerRegistration(sel_off, decision)
-                            else:
-                                print("Invalid choice.")
-                        except:
-                            print("Invalid input.")
-
-                elif choice == '8':
-                    current_user.generateApplicantReport(app_controller.applications)
-
-                elif choice == '9':
-                    all_inqs = inq_controller.getAllInquiries()
-                    if not all_inqs:
-                        print("No enquiries.")
-                    else:
-                        for i, enq in enumerate(all_inqs, start=1):
-                            print(f"{i}. From {enq.applicant.name}: {enq.message}")
-                            if enq.response:
-                                print(f"   Response: {enq.response}")
-
-                elif choice == '10':
-                    all_inqs = inq_controller.getAllInquiries()
-                    if not all_inqs:
-                        print("No enquiries to reply to.")
-                    else:
-                        for i, enq in enumerate(all_inqs, start=1):
-                            print(f"{i}. From {enq.applicant.name}: {enq.message} (response: {enq.response})")
-                        c = input("Select an enquiry to reply: ")
-                        try:
-                            idx = int(c) - 1
-                            if 0 <= idx < len(all_inqs):
-                                sel_enq = all_inqs[idx]
-                                resp = input("Enter reply: ")
-                                inq_controller.replyInquiry(sel_enq, resp)
-                                print("Replied successfully.")
-                            else:
-                                print("Invalid choice.")
-                        except:
-                            print("Invalid input.")
-
-                elif choice == '11':
-                    new_pw = input("Enter new password: ")
-                    current_user.changePassword(new_pw)
-
-                elif choice == '12':
-                    globals()['current_user'] = None
-                else:
-                    print("Invalid choice.")
-
-            else:
-                print("Unknown user type. Logging out.")
-                globals()['current_user'] = None
+            _invalid_choice()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+"""
+Optional build: compile main.py into a C extension with Cython.
+
+    python setup.py build_ext --inplace
+    python -c "import main; main.main()"
+
+main.py stays plain Python, so `python main.py` keeps working without Cython.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="hdb-bto",
+    ext_modules=cythonize("main.py", language_level=3),
+)